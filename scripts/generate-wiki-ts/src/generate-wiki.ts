@@ -10,7 +10,7 @@ import { parseArgs } from 'util';
 import { existsSync } from 'fs';
 import { join } from 'path';
 import { JavaProtocolParser } from './parser';
-import { WikiGenerator, generateJsonSummary } from './wiki-generator';
+import { WikiGenerator, countPackets, generateJsonSummary } from './wiki-generator';
 import { LayoutAnalyzer } from './layout-analyzer';
 
 interface Args {
@@ -139,10 +139,10 @@ async function main(): Promise<number> {
     // Parse all Java files using tree-sitter
     console.log('🔍 Parsing protocol files...');
     const parser = new JavaProtocolParser(args.protocolDir);
-    const { packetsByCategory, enums, dataClasses } = parser.parseAll();
+    const { packetsByCategory, enums, dataClasses } = await parser.parseAll();
 
     // Summary statistics
-    const totalPackets = Array.from(packetsByCategory.values()).reduce((sum, pkts) => sum + pkts.length, 0);
+    const totalPackets = countPackets(packetsByCategory);
     console.log('');
     console.log('📊 Parsing complete:');
     console.log(`   ├─ ${totalPackets} packets in ${packetsByCategory.size} categories`);
@@ -174,7 +174,7 @@ async function main(): Promise<number> {
 
     // Generate wiki pages
     console.log('📝 Generating wiki documentation...');
-    generator.generate(packetsByCategory, enums, dataClasses);
+    await generator.generate(packetsByCategory, enums, dataClasses);
     console.log('');
 
     // Generate JSON summary if requested
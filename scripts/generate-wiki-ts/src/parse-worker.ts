@@ -0,0 +1,16 @@
+/**
+ * Worker-thread entry point for parallel Java parsing.
+ *
+ * Receives a batch of parse tasks, runs them with a worker-local parser
+ * instance (tree-sitter parsers are not shareable across threads) and posts
+ * the plain-object results back for merging on the main thread.
+ */
+
+import { parentPort, workerData } from 'worker_threads';
+import { JavaProtocolParser } from './parser';
+import type { ParseTask } from './parser';
+
+const { protocolDir, tasks } = workerData as { protocolDir: string; tasks: ParseTask[] };
+
+const parser = new JavaProtocolParser(protocolDir);
+parentPort!.postMessage(tasks.map(task => parser.runTask(task)));
@@ -4,16 +4,87 @@
 
 import Parser from 'tree-sitter';
 import Java from 'tree-sitter-java';
-import { readFileSync, readdirSync, statSync } from 'fs';
-import { join, relative } from 'path';
+import { mkdirSync, readFileSync, readdirSync, writeFileSync } from 'fs';
+import { readFile } from 'fs/promises';
+import { createHash } from 'crypto';
+import { dirname, join, sep } from 'path';
+import { availableParallelism } from 'os';
+import { Worker } from 'worker_threads';
 import type { PacketInfo, EnumInfo, DataClassInfo, FieldInfo, EnumValue, ParsedResults } from './types';
 
+/** A single file to parse, tagged with how its results should be used */
+export interface ParseTask {
+  kind: 'entity' | 'packet' | 'packetEnums';
+  path: string;
+  relPath: string;
+}
+
+/** Structured-cloneable result of one ParseTask, merged on the main thread */
+export interface ParseTaskResult {
+  packet?: PacketInfo | null;
+  enums?: EnumInfo[];
+  dataClasses?: DataClassInfo[];
+}
+
+// Below this many tasks, worker startup (thread spawn + tree-sitter language
+// load per worker) costs more than it saves; parse inline instead.
+const MIN_TASKS_PER_WORKER = 32;
+
+// On-disk cache of parsed packet files keyed by content hash: unchanged
+// sources skip the tree-sitter parse entirely on repeat runs. Bump the
+// version whenever the extracted PacketInfo shape or logic changes.
+const PARSE_CACHE_VERSION = 1;
+const PARSE_CACHE_DIR = join('.cache', 'parser');
+
+// Package names, categories and Java types come from a small recurring
+// vocabulary, but each occurrence is extracted as a fresh substring that keeps
+// a slice of its source file alive. Interning makes equal values share one
+// string, shrinking the retained object graph across thousands of fields.
+const internPool = new Map<string, string>();
+
+function intern(value: string): string {
+  let pooled = internPool.get(value);
+  if (pooled === undefined) {
+    internPool.set(value, value);
+    pooled = value;
+  }
+  return pooled;
+}
+
+// Compiled once at module load and shared across parser instances, so repeated
+// invocations (e.g. looping over protocol versions) don't re-create the RegExp
+// objects for every file scanned.
+// Fused package/import alternation: one scan over the file content replaces
+// the separate package and import passes.
+const HEADER_RE = /(package|import)\s+([\w.]+);/g;
+
+interface FileHeader {
+  packageName: string;
+  imports: string[];
+}
+
+// Numeric `public static final` constants mapped to the PacketInfo property
+// they populate. IS_COMPRESSED is boolean-valued and handled separately.
+const PACKET_CONSTANT_PROPS = {
+  PACKET_ID: 'packetId',
+  NULLABLE_BIT_FIELD_SIZE: 'nullableBitFieldSize',
+  FIXED_BLOCK_SIZE: 'fixedBlockSize',
+  VARIABLE_FIELD_COUNT: 'variableFieldCount',
+  VARIABLE_BLOCK_START: 'variableBlockStart',
+  MAX_SIZE: 'maxSize'
+} as const;
+
+// All constants relevant to deserialization, shared by extractConstants and
+// extractRelevantConstants so the two stay in sync.
+const RELEVANT_CONSTANT_NAMES = new Set(['IS_COMPRESSED', ...Object.keys(PACKET_CONSTANT_PROPS)]);
+
 export class JavaProtocolParser {
   private parser: Parser;
   private protocolDir: string;
   private packetsDir: string;
   private enums: Map<string, EnumInfo> = new Map();
   private dataClasses: Map<string, DataClassInfo> = new Map();
+  private cacheDirReady = false;
 
   constructor(protocolDir: string) {
     this.protocolDir = protocolDir;
@@ -23,16 +94,41 @@ export class JavaProtocolParser {
     this.parser.setLanguage(Java);
   }
 
-  parseAll(): ParsedResults {
+  async parseAll(): Promise<ParsedResults> {
     console.log('Parsing protocol entities...');
-    this.parseProtocolEntities();
+    const entityTasks = this.collectTasks(this.protocolDir, 'entity');
+    for (const result of await this.runTasks(entityTasks)) {
+      for (const enumInfo of result.enums ?? []) {
+        this.enums.set(enumInfo.name, enumInfo);
+      }
+      for (const dataClassInfo of result.dataClasses ?? []) {
+        this.dataClasses.set(dataClassInfo.name, dataClassInfo);
+      }
+    }
 
     console.log('Parsing packets...');
-    const packetsByCategory = this.parsePackets();
+    const packetTasks = this.collectTasks(this.packetsDir, 'packet');
+    const packetsByCategory = new Map<string, PacketInfo[]>();
+    for (const result of await this.runTasks(packetTasks)) {
+      const packet = result.packet;
+      if (packet) {
+        if (!packetsByCategory.has(packet.category)) {
+          packetsByCategory.set(packet.category, []);
+        }
+        packetsByCategory.get(packet.category)!.push(packet);
+      }
+    }
 
     // Also parse enums from the packets directory (some enums are defined alongside packets)
     console.log('Parsing enums from packets directory...');
-    this.parseEnumsFromPacketsDirectory(this.packetsDir, '');
+    const enumTasks: ParseTask[] = packetTasks.map(task => ({ ...task, kind: 'packetEnums' }));
+    for (const result of await this.runTasks(enumTasks)) {
+      for (const enumInfo of result.enums ?? []) {
+        if (!this.enums.has(enumInfo.name)) {
+          this.enums.set(enumInfo.name, enumInfo);
+        }
+      }
+    }
 
     return {
       packetsByCategory,
@@ -41,101 +137,175 @@ export class JavaProtocolParser {
     };
   }
 
-  private parseProtocolEntities(): void {
-    this.parseEntityDirectory(this.protocolDir, '');
+  /** Run one parse task synchronously. Also the entry point used by parse workers. */
+  runTask(task: ParseTask, content?: string): ParseTaskResult {
+    if (task.kind === 'packet') {
+      return { packet: this.parsePacketFile(task.path, task.relPath, content) };
+    }
+    if (task.kind === 'packetEnums') {
+      // Only parse enums from this file, skip packet classes
+      return { enums: this.parseEnumsFromFile(task.path, task.relPath, content) };
+    }
+    return this.parseEntityFile(task.path, task.relPath, content);
+  }
+
+  /**
+   * Run parse tasks, fanning out to worker threads when the file count makes
+   * the thread spawn worthwhile. Results come back in task order so merge
+   * semantics match the old sequential walk exactly; any worker failure falls
+   * back to parsing inline on the main thread.
+   */
+  private async runTasks(tasks: ParseTask[]): Promise<ParseTaskResult[]> {
+    const workerCount = Math.min(availableParallelism(), Math.floor(tasks.length / MIN_TASKS_PER_WORKER));
+    if (workerCount <= 1) {
+      return this.runTasksInline(tasks);
+    }
+
+    const chunkSize = Math.ceil(tasks.length / workerCount);
+    const chunks: ParseTask[][] = [];
+    for (let i = 0; i < tasks.length; i += chunkSize) {
+      chunks.push(tasks.slice(i, i + chunkSize));
+    }
+
+    try {
+      const results = await Promise.all(chunks.map(chunk => this.runWorker(chunk)));
+      return results.flat();
+    } catch (error) {
+      console.warn('⚠️  Parallel parsing failed, falling back to single thread:', error instanceof Error ? error.message : String(error));
+      return this.runTasksInline(tasks);
+    }
   }
 
-  private parseEntityDirectory(dir: string, relPath: string): void {
-    const entries = readdirSync(dir);
+  /**
+   * Single-threaded task execution with asynchronous read-ahead: a window of
+   * upcoming files is fetched on libuv's threadpool while the main thread
+   * parses the ones already in memory, hiding per-file I/O latency behind
+   * parse time. Failed reads fall through to the synchronous path so the
+   * per-file error handling stays unchanged.
+   */
+  private async runTasksInline(tasks: ParseTask[]): Promise<ParseTaskResult[]> {
+    const READ_AHEAD = 16;
+    const results: ParseTaskResult[] = new Array(tasks.length);
+    const reads: Array<Promise<string | null> | null> = new Array(tasks.length).fill(null);
+    const readAt = (i: number): Promise<string | null> => readFile(tasks[i].path, 'utf-8').catch(() => null);
+
+    for (let i = 0; i < Math.min(READ_AHEAD, tasks.length); i++) {
+      reads[i] = readAt(i);
+    }
 
-    for (const entry of entries) {
-      const fullPath = join(dir, entry);
-      const stat = statSync(fullPath);
-
-      if (stat.isDirectory()) {
-        if (entry === 'packets') continue; // Skip packets dir, handled separately
-        this.parseEntityDirectory(fullPath, join(relPath, entry));
-      } else if (entry.endsWith('.java')) {
-        this.parseEntityFile(fullPath, relPath);
+    for (let i = 0; i < tasks.length; i++) {
+      const next = i + READ_AHEAD;
+      if (next < tasks.length) {
+        reads[next] = readAt(next);
       }
+      const content = await reads[i]!;
+      reads[i] = null; // Release the buffer as soon as it has been parsed
+      results[i] = this.runTask(tasks[i], content ?? undefined);
     }
+
+    return results;
   }
 
-  private parseEnumsFromPacketsDirectory(dir: string, relPath: string): void {
-    const entries = readdirSync(dir);
+  private runWorker(tasks: ParseTask[]): Promise<ParseTaskResult[]> {
+    return new Promise((resolve, reject) => {
+      const worker = new Worker(new URL('./parse-worker.ts', import.meta.url), {
+        workerData: { protocolDir: this.protocolDir, tasks }
+      });
+      worker.once('message', resolve);
+      worker.once('error', reject);
+      worker.once('exit', (code) => {
+        if (code !== 0) {
+          reject(new Error(`Parse worker exited with code ${code}`));
+        }
+      });
+    });
+  }
 
+  private collectTasks(dir: string, kind: ParseTask['kind']): ParseTask[] {
+    const tasks: ParseTask[] = [];
+    // One C-level recursive scan replaces the JS-level readdir/stat recursion
+    const entries = readdirSync(dir, { recursive: true }) as string[];
     for (const entry of entries) {
-      const fullPath = join(dir, entry);
-      const stat = statSync(fullPath);
-
-      if (stat.isDirectory()) {
-        this.parseEnumsFromPacketsDirectory(fullPath, join(relPath, entry));
-      } else if (entry.endsWith('.java')) {
-        // Only parse enums from this file, skip packet classes
-        this.parseEnumsFromFile(fullPath, relPath);
-      }
+      if (!entry.endsWith('.java')) continue;
+      if (kind === 'entity' && entry.split(sep).includes('packets')) continue; // Skip packets dir, handled separately
+      const relDir = dirname(entry);
+      tasks.push({ kind, path: join(dir, entry), relPath: relDir === '.' ? '' : relDir });
     }
+    return tasks;
   }
 
-  private parseEnumsFromFile(filePath: string, relPath: string): void {
+  private parseEnumsFromFile(filePath: string, relPath: string, fileContent?: string): EnumInfo[] {
+    const enums: EnumInfo[] = [];
     try {
-      const buffer = readFileSync(filePath);
-      const content = String(buffer.toString('utf-8'));
+      const content = fileContent ?? readFileSync(filePath, 'utf-8');
+
+      if (content.trim().length === 0) {
+        return enums;
+      }
 
-      if (typeof content !== 'string' || content.trim().length === 0) {
-        return;
+      // Cheap substring pre-check: most packet files declare no enum at all,
+      // so skip the full tree-sitter parse for them.
+      if (!content.includes('enum')) {
+        return enums;
       }
 
       const tree = this.parser.parse(content);
       if (!tree || !tree.rootNode) {
-        return;
+        return enums;
       }
 
-      const category = relPath.replace(/\\/g, '/') || 'root';
+      const category = intern(relPath.replace(/\\/g, '/') || 'root');
+      let header: FileHeader | null = null;
 
       this.traverseTree(tree.rootNode, (node) => {
         if (node.type === 'enum_declaration') {
-          const enumInfo = this.extractEnumInfo(node, content, category, relPath);
-          if (enumInfo && !this.enums.has(enumInfo.name)) {
-            this.enums.set(enumInfo.name, enumInfo);
+          // Scan the header lazily: only files that declare an enum need it
+          header ??= this.extractHeader(content);
+          const enumInfo = this.extractEnumInfo(node, content, category, relPath, header);
+          if (enumInfo) {
+            enums.push(enumInfo);
           }
         }
       });
     } catch (error) {
       // Silently skip files that can't be parsed for enums
     }
+    return enums;
   }
 
-  private parseEntityFile(filePath: string, relPath: string): void {
+  private parseEntityFile(filePath: string, relPath: string, fileContent?: string): ParseTaskResult {
+    const enums: EnumInfo[] = [];
+    const dataClasses: DataClassInfo[] = [];
     try {
-      const buffer = readFileSync(filePath);
-      const content = String(buffer.toString('utf-8'));
-      
-      // Validate content is a non-empty string
-      if (typeof content !== 'string' || content.trim().length === 0) {
+      // Decode straight to a string; no intermediate Buffer copy
+      const content = fileContent ?? readFileSync(filePath, 'utf-8');
+
+      if (content.trim().length === 0) {
         console.warn(`⚠️  Skipping empty or invalid file: ${filePath}`);
-        return;
+        return { enums, dataClasses };
       }
-      
+
       // Parse directly with the string
       const tree = this.parser.parse(content);
       if (!tree || !tree.rootNode) {
         console.warn(`⚠️  Failed to parse file: ${filePath}`);
-        return;
+        return { enums, dataClasses };
       }
-      
-      const category = relPath.replace(/\\/g, '/') || 'root';
-      
+
+      const category = intern(relPath.replace(/\\/g, '/') || 'root');
+      // One header scan per file, shared by every declaration it contains
+      const header = this.extractHeader(content);
+
       this.traverseTree(tree.rootNode, (node) => {
         if (node.type === 'enum_declaration') {
-          const enumInfo = this.extractEnumInfo(node, content, category, relPath);
+          const enumInfo = this.extractEnumInfo(node, content, category, relPath, header);
           if (enumInfo) {
-            this.enums.set(enumInfo.name, enumInfo);
+            enums.push(enumInfo);
           }
         } else if (node.type === 'class_declaration') {
-          const dataClassInfo = this.extractDataClassInfo(node, content, category, relPath);
+          const dataClassInfo = this.extractDataClassInfo(node, content, category, relPath, header);
           if (dataClassInfo && !dataClassInfo.name.includes('Packet')) {
-            this.dataClasses.set(dataClassInfo.name, dataClassInfo);
+            dataClasses.push(dataClassInfo);
           }
         }
       });
@@ -143,46 +313,27 @@ export class JavaProtocolParser {
       console.error(`❌ Error parsing file ${filePath}:`, error instanceof Error ? error.message : String(error));
       // Continue processing other files
     }
+    return { enums, dataClasses };
   }
 
-  private parsePackets(): Map<string, PacketInfo[]> {
-    const packetsByCategory = new Map<string, PacketInfo[]>();
-    this.parsePacketDirectory(this.packetsDir, '', packetsByCategory);
-    return packetsByCategory;
-  }
-
-  private parsePacketDirectory(dir: string, relPath: string, result: Map<string, PacketInfo[]>): void {
-    const entries = readdirSync(dir);
-    for (const entry of entries) {
-      const fullPath = join(dir, entry);
-      const stat = statSync(fullPath);
-      
-      if (stat.isDirectory()) {
-        this.parsePacketDirectory(fullPath, join(relPath, entry), result);
-      } else if (entry.endsWith('.java')) {
-        const packet = this.parsePacketFile(fullPath, relPath);
-        if (packet) {
-          const category = relPath.replace(/\\/g, '/') || 'uncategorized';
-          if (!result.has(category)) {
-            result.set(category, []);
-          }
-          result.get(category)!.push(packet);
-        }
-      }
-    }
-  }
-
-  private parsePacketFile(filePath: string, relPath: string): PacketInfo | null {
+  private parsePacketFile(filePath: string, relPath: string, fileContent?: string): PacketInfo | null {
     try {
-      const buffer = readFileSync(filePath);
-      const content = String(buffer.toString('utf-8'));
-      
-      // Validate content is a non-empty string
-      if (typeof content !== 'string' || content.trim().length === 0) {
+      // Decode straight to a string; no intermediate Buffer copy
+      const content = fileContent ?? readFileSync(filePath, 'utf-8');
+
+      if (content.trim().length === 0) {
         console.warn(`⚠️  Skipping empty or invalid packet file: ${filePath}`);
         return null;
       }
-      
+
+      // Identical source always parses to the identical result, so a
+      // content-hash hit can skip the parse on incremental re-runs
+      const cachePath = this.packetCachePath(relPath, content);
+      const cached = this.readPacketCache(cachePath);
+      if (cached !== undefined) {
+        return cached;
+      }
+
       // Parse directly with the string
       const tree = this.parser.parse(content);
       if (!tree || !tree.rootNode) {
@@ -190,19 +341,22 @@ export class JavaProtocolParser {
         return null;
       }
       
-      const category = relPath.replace(/\\/g, '/') || 'uncategorized';
-      
+      const category = intern(relPath.replace(/\\/g, '/') || 'uncategorized');
+      // One header scan per file, shared by every class declaration it contains
+      const header = this.extractHeader(content);
+
       let packetInfo: PacketInfo | null = null;
-      
+
       this.traverseTree(tree.rootNode, (node) => {
         if (node.type === 'class_declaration') {
           const className = this.getNodeText(node.childForFieldName('name'), content);
           if (className) {
-            packetInfo = this.extractPacketInfo(node, content, category);
+            packetInfo = this.extractPacketInfo(node, content, category, header);
           }
         }
       });
       
+      this.writePacketCache(cachePath, packetInfo);
       return packetInfo;
     } catch (error) {
       console.error(`❌ Error parsing packet file ${filePath}:`, error instanceof Error ? error.message : String(error));
@@ -210,14 +364,44 @@ export class JavaProtocolParser {
     }
   }
 
-  private extractPacketInfo(node: Parser.SyntaxNode, content: string, category: string): PacketInfo {
+  private packetCachePath(relPath: string, content: string): string {
+    // relPath feeds the packet's category, so it is part of the cache key
+    const hash = createHash('sha256').update(relPath).update('\0').update(content).digest('hex').slice(0, 32);
+    return join(PARSE_CACHE_DIR, `v${PARSE_CACHE_VERSION}-${hash}.json`);
+  }
+
+  /** Returns the cached result (which may be null) or undefined on a miss */
+  private readPacketCache(cachePath: string): PacketInfo | null | undefined {
+    try {
+      return JSON.parse(readFileSync(cachePath, 'utf-8'));
+    } catch {
+      return undefined;
+    }
+  }
+
+  private writePacketCache(cachePath: string, packet: PacketInfo | null): void {
+    try {
+      if (!this.cacheDirReady) {
+        mkdirSync(PARSE_CACHE_DIR, { recursive: true });
+        this.cacheDirReady = true;
+      }
+      writeFileSync(cachePath, JSON.stringify(packet));
+    } catch {
+      // Cache writes are best-effort; parsing already succeeded
+    }
+  }
+
+  private extractPacketInfo(node: Parser.SyntaxNode, content: string, category: string, header: FileHeader): PacketInfo {
     const className = this.getNodeText(node.childForFieldName('name'), content) || 'Unknown';
-    const packageName = this.extractPackage(content);
-    
+
+    // Declare every property up front, including the optional ones filled in
+    // later, so all PacketInfo objects share one hidden class in V8 instead of
+    // transitioning shapes when packetId/deserializeContext get added
     const packet: PacketInfo = {
       name: className,
-      package: packageName,
+      package: header.packageName,
       category,
+      packetId: undefined,
       isCompressed: false,
       nullableBitFieldSize: 0,
       fixedBlockSize: 0,
@@ -225,9 +409,10 @@ export class JavaProtocolParser {
       variableBlockStart: 0,
       maxSize: 0,
       fields: [],
-      imports: this.extractImports(content),
+      imports: header.imports,
       isEnum: false,
-      isDataClass: false
+      isDataClass: false,
+      deserializeContext: undefined
     };
     
     // Extract constants
@@ -242,17 +427,18 @@ export class JavaProtocolParser {
     return packet;
   }
 
-  private extractEnumInfo(node: Parser.SyntaxNode, content: string, category: string, relPath: string): EnumInfo | null {
+  private extractEnumInfo(node: Parser.SyntaxNode, content: string, category: string, relPath: string, header: FileHeader): EnumInfo | null {
     const enumName = this.getNodeText(node.childForFieldName('name'), content);
     if (!enumName) return null;
-    
-    const packageName = this.extractPackage(content);
+
     const values: EnumValue[] = [];
     
-    // Find enum body
+    // Enum constants are direct children of the enum body; walking only them
+    // bounds the scan precisely (a full subtree traversal would also pick up
+    // constants of nested enums)
     const body = node.childForFieldName('body');
     if (body) {
-      this.traverseTree(body, (child) => {
+      for (const child of body.namedChildren) {
         if (child.type === 'enum_constant') {
           const name = this.getNodeText(child.childForFieldName('name'), content);
           if (name) {
@@ -272,23 +458,22 @@ export class JavaProtocolParser {
             values.push({ name, value });
           }
         }
-      });
+      }
     }
     
     return {
       name: enumName,
-      package: packageName,
+      package: header.packageName,
       category,
       sourcePath: relPath,
       values
     };
   }
 
-  private extractDataClassInfo(node: Parser.SyntaxNode, content: string, category: string, relPath: string): DataClassInfo | null {
+  private extractDataClassInfo(node: Parser.SyntaxNode, content: string, category: string, relPath: string, header: FileHeader): DataClassInfo | null {
     const className = this.getNodeText(node.childForFieldName('name'), content);
     if (!className) return null;
-    
-    const packageName = this.extractPackage(content);
+
     const fields: FieldInfo[] = [];
     
     // Extract fields from class body
@@ -306,11 +491,11 @@ export class JavaProtocolParser {
     
     return {
       name: className,
-      package: packageName,
+      package: header.packageName,
       category,
       sourcePath: relPath,
       fields,
-      imports: this.extractImports(content)
+      imports: header.imports
     };
   }
 
@@ -334,14 +519,12 @@ export class JavaProtocolParser {
               if (name === 'IS_COMPRESSED') {
                 packet.isCompressed = value === 'true';
               } else {
-                const numValue = parseInt(value);
-                if (!isNaN(numValue)) {
-                  if (name === 'PACKET_ID') packet.packetId = numValue;
-                  else if (name === 'NULLABLE_BIT_FIELD_SIZE') packet.nullableBitFieldSize = numValue;
-                  else if (name === 'FIXED_BLOCK_SIZE') packet.fixedBlockSize = numValue;
-                  else if (name === 'VARIABLE_FIELD_COUNT') packet.variableFieldCount = numValue;
-                  else if (name === 'VARIABLE_BLOCK_START') packet.variableBlockStart = numValue;
-                  else if (name === 'MAX_SIZE') packet.maxSize = numValue;
+                const prop = PACKET_CONSTANT_PROPS[name as keyof typeof PACKET_CONSTANT_PROPS];
+                if (prop) {
+                  const numValue = parseInt(value);
+                  if (!isNaN(numValue)) {
+                    packet[prop] = numValue;
+                  }
                 }
               }
             }
@@ -433,7 +616,7 @@ export class JavaProtocolParser {
         const nameNode = param.childForFieldName('name');
 
         if (typeNode && nameNode) {
-          const javaType = this.getNodeText(typeNode, content);
+          const javaType = intern(this.getNodeText(typeNode, content));
           const name = this.getNodeText(nameNode, content);
 
           // Check for nullability annotations - find modifiers by looking through children
@@ -473,7 +656,7 @@ export class JavaProtocolParser {
     if (!typeNode || !declarator) return null;
 
     const name = this.getNodeText(declarator.childForFieldName('name'), content);
-    const javaType = this.getNodeText(typeNode, content);
+    const javaType = intern(this.getNodeText(typeNode, content));
 
     if (!name || !javaType) return null;
 
@@ -629,10 +812,6 @@ export class JavaProtocolParser {
    */
   private extractRelevantConstants(body: Parser.SyntaxNode, content: string): string[] {
     const constants: string[] = [];
-    const relevantNames = [
-      'PACKET_ID', 'IS_COMPRESSED', 'NULLABLE_BIT_FIELD_SIZE',
-      'FIXED_BLOCK_SIZE', 'VARIABLE_FIELD_COUNT', 'VARIABLE_BLOCK_START', 'MAX_SIZE'
-    ];
 
     this.traverseTree(body, (child) => {
       if (child.type === 'field_declaration') {
@@ -644,7 +823,7 @@ export class JavaProtocolParser {
           const declarator = child.children.find((c: Parser.SyntaxNode) => c.type === 'variable_declarator');
           if (declarator) {
             const name = this.getNodeText(declarator.childForFieldName('name'), content);
-            if (name && relevantNames.includes(name)) {
+            if (name && RELEVANT_CONSTANT_NAMES.has(name)) {
               constants.push(this.getNodeText(child, content).trim());
             }
           }
@@ -716,18 +895,17 @@ export class JavaProtocolParser {
     return null;
   }
 
-  private extractPackage(content: string): string {
-    const match = content.match(/package\s+([\w.]+);/);
-    return match ? match[1] : '';
-  }
-
-  private extractImports(content: string): string[] {
+  private extractHeader(content: string): FileHeader {
+    let packageName = '';
     const imports: string[] = [];
-    const matches = content.matchAll(/import\s+([\w.]+);/g);
-    for (const match of matches) {
-      imports.push(match[1]);
+    for (const match of content.matchAll(HEADER_RE)) {
+      if (match[1] === 'package') {
+        if (!packageName) packageName = match[2];
+      } else {
+        imports.push(match[2]);
+      }
     }
-    return imports;
+    return { packageName: intern(packageName), imports };
   }
 
   private getNodeText(node: Parser.SyntaxNode | null, content: string): string {
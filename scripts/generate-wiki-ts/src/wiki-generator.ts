@@ -2,18 +2,128 @@
  * Wiki documentation generator
  */
 
-import { writeFileSync, existsSync, mkdirSync, readFileSync } from 'fs';
-import { join } from 'path';
+import { existsSync, mkdirSync, readFileSync, readdirSync, openSync, writeSync, closeSync } from 'fs';
+import { readFile, writeFile } from 'fs/promises';
+import { join, resolve } from 'path';
 import type { PacketInfo, EnumInfo, DataClassInfo, LayoutAnalysis, FieldLayoutInfo } from './types';
 
+/**
+ * Reduce a Java type to its simple name: strip generic parameters and package
+ * qualifiers. Avoids regex/split allocations when neither is present.
+ */
+function simpleTypeName(javaType: string): string {
+  const base = javaType.includes('<') ? javaType.replace(/<.*>/, '') : javaType;
+  const dot = base.lastIndexOf('.');
+  return dot === -1 ? base : base.slice(dot + 1);
+}
+
+/** Total packet count across all categories, without materializing arrays */
+export function countPackets(packetsByCategory: Map<string, PacketInfo[]>): number {
+  let total = 0;
+  for (const packets of packetsByCategory.values()) {
+    total += packets.length;
+  }
+  return total;
+}
+
+// Patterns used to recover version names from existing root pages, compiled
+// once at module load. Iterate them with matchAll (which clones the regex) so
+// the shared lastIndex never leaks between calls.
+const HOME_VERSION_LINK_RE = /\[([^\]]+)\]\([^)]*-Home\)/g;
+const SIDEBAR_VERSION_HEADING_RE = /## (.+)/g;
+
+// Version home pages are written as `<version>-Home.md`; the version can be
+// recovered straight from the filename in one regex call
+const VERSION_HOME_FILE_RE = /^(.+)-Home\.md$/;
+
+// The root sidebar shows only the newest versions; the full list stays on the
+// root home page
+const SIDEBAR_MAX_VERSIONS = 10;
+
+/**
+ * Accumulates page text as a single growing string (cheap rope concatenation
+ * in V8) instead of a line array that gets joined afterwards.
+ */
+class PageBuffer {
+  private text = '';
+
+  line(s: string): void {
+    if (this.text.length > 0) {
+      this.text += '\n';
+    }
+    this.text += s;
+  }
+
+  toString(): string {
+    return this.text;
+  }
+}
+
+// Byte-size units in ascending order; formatByteSize picks the largest unit
+// the size reaches, so sizes beyond the last entry still render in that unit
+const BYTE_SIZE_UNITS = [
+  [1024, 'KB'],
+  [1024 * 1024, 'MB']
+] as const;
+
+// Markdown table headers shared across pages, built once instead of per call
+const PACKET_INDEX_TABLE_HEAD = [
+  '| ID | Name | Package | Compressed | Max Size |',
+  '|----|------|---------|------------|----------|'
+] as const;
+const PROPERTY_TABLE_HEAD = [
+  '| Property | Value |',
+  '|----------|-------|'
+] as const;
+const LAYOUT_FIELDS_TABLE_HEAD = [
+  '| Name | Type | Offset | Size | Encoding | Nullable |',
+  '|------|------|--------|------|----------|----------|'
+] as const;
+const BASIC_FIELDS_TABLE_HEAD = [
+  '| Name | Type | Nullable | Max Length |',
+  '|------|------|----------|------------|'
+] as const;
+const ENUM_VALUES_TABLE_HEAD = [
+  '| Name | Value |',
+  '|------|-------|'
+] as const;
+const DATA_FIELDS_TABLE_HEAD = [
+  '| Field | Type | Nullable |',
+  '|-------|------|----------|'
+] as const;
+
 export class WikiGenerator {
   private outputDir: string;
   private version: string;
+  // Version-scoped page names recur in links on every generated page
+  private readonly homePage: string;
+  private readonly enumsPage: string;
+  private readonly dataTypesPage: string;
   private layouts: Map<string, LayoutAnalysis>;
+  // Memoized render helpers: the same Java types and sizes recur across
+  // thousands of fields within one run
+  private typeLinkCache: Map<string, string> = new Map();
+  private byteSizeCache: Map<number, string> = new Map();
+  private displayNames: Map<string, string> = new Map();
+  // Lookup sets for the generation in progress, so render helpers on the hot
+  // path don't need them threaded through every call
+  private enums: Map<string, EnumInfo> = new Map();
+  // Fully rendered wiki links keyed by simple type name, anchors lowercased
+  // once up front instead of on every field
+  private typeAnchors: Map<string, string> = new Map();
+  private sortedVersions: string[] | null = null;
+  // In-flight page writes; generate() awaits the whole batch at the end so
+  // building the next page overlaps with writing the previous ones
+  private pendingWrites: Promise<void>[] = [];
 
   constructor(outputDir: string, version: string) {
-    this.outputDir = outputDir;
+    // Resolve once so every per-page open works with an already-normalized
+    // absolute path instead of re-normalizing against cwd on each write
+    this.outputDir = resolve(outputDir);
     this.version = version;
+    this.homePage = this.pageName(`${version}-Home`);
+    this.enumsPage = this.pageName(`${version}-Enums`);
+    this.dataTypesPage = this.pageName(`${version}-Data-Types`);
     this.layouts = new Map();
 
     if (!existsSync(outputDir)) {
@@ -28,41 +138,68 @@ export class WikiGenerator {
     this.layouts = layouts;
   }
 
-  generate(
+  async generate(
     packetsByCategory: Map<string, PacketInfo[]>,
     enums: Map<string, EnumInfo>,
     dataClasses: Map<string, DataClassInfo>
-  ): void {
+  ): Promise<void> {
     console.log('Generating wiki documentation...');
+    this.pendingWrites = [];
+
+    // Type links depend on the enum/data-class sets passed to this call
+    this.enums = enums;
+    this.typeLinkCache.clear();
+    this.typeAnchors.clear();
+    for (const name of enums.keys()) {
+      this.typeAnchors.set(name, `[${name}](${this.enumsPage}#${name.toLowerCase()})`);
+    }
+    for (const name of dataClasses.keys()) {
+      // Enums take precedence when a name appears in both sets
+      if (!this.typeAnchors.has(name)) {
+        this.typeAnchors.set(name, `[${name}](${this.dataTypesPage}#${name.toLowerCase()})`);
+      }
+    }
+
+    // Category order is shared by the home page and the sidebar; sort once
+    const sortedCategories = Array.from(packetsByCategory.keys()).sort();
+
+    // Display names recur on the home page, every category page and the sidebar
+    this.displayNames = new Map(sortedCategories.map(c => [c, this.formatCategoryName(c)]));
 
     // Generate version home page
-    this.generateVersionHome(packetsByCategory, enums, dataClasses);
+    this.generateVersionHome(packetsByCategory, enums, dataClasses, sortedCategories, countPackets(packetsByCategory));
 
     // Generate category pages
     for (const [category, packets] of packetsByCategory) {
-      this.generateCategoryPage(category, packets, enums, dataClasses);
+      this.generateCategoryPage(category, packets);
     }
 
     // Generate enums page
     this.generateEnumsPage(enums);
 
     // Generate data types page
-    this.generateDataTypesPage(dataClasses, enums);
+    this.generateDataTypesPage(dataClasses);
 
     // Generate version sidebar
-    this.generateVersionSidebar(packetsByCategory);
+    this.generateVersionSidebar(sortedCategories);
 
     // Update root home and sidebar
     this.generateRootHome();
     this.generateRootSidebar();
 
-    console.log(`✓ Generated wiki for version ${this.version}`);
+    await Promise.all(this.pendingWrites);
+    const pageCount = this.pendingWrites.length;
+    this.pendingWrites = [];
+
+    console.log(`✓ Generated ${pageCount} pages for version ${this.version}`);
   }
 
   private generateVersionHome(
     packetsByCategory: Map<string, PacketInfo[]>,
     enums: Map<string, EnumInfo>,
-    dataClasses: Map<string, DataClassInfo>
+    dataClasses: Map<string, DataClassInfo>,
+    sortedCategories: string[],
+    totalPackets: number
   ): void {
     const lines: string[] = [];
 
@@ -72,7 +209,6 @@ export class WikiGenerator {
     lines.push('');
 
     // Statistics
-    const totalPackets = Array.from(packetsByCategory.values()).reduce((sum, pkts) => sum + pkts.length, 0);
     lines.push('## Overview');
     lines.push('');
     lines.push(`- **Version**: ${this.version}`);
@@ -86,10 +222,9 @@ export class WikiGenerator {
     lines.push('## Packet Categories');
     lines.push('');
 
-    const sortedCategories = Array.from(packetsByCategory.keys()).sort();
     for (const category of sortedCategories) {
       const packets = packetsByCategory.get(category)!;
-      const displayName = this.formatCategoryName(category);
+      const displayName = this.displayNames.get(category) ?? this.formatCategoryName(category);
       lines.push(`### [${displayName}](${this.pageName(`${this.version}-${category}`)})`);
       lines.push('');
       lines.push(`${packets.length} packet${packets.length !== 1 ? 's' : ''}`);
@@ -99,21 +234,16 @@ export class WikiGenerator {
     // Quick links
     lines.push('## Quick Links');
     lines.push('');
-    lines.push(`- [Enums](${this.pageName(`${this.version}-Enums`)})`);
-    lines.push(`- [Data Types](${this.pageName(`${this.version}-Data-Types`)})`);
+    lines.push(`- [Enums](${this.enumsPage})`);
+    lines.push(`- [Data Types](${this.dataTypesPage})`);
     lines.push('');
 
     this.writePage(`${this.version}-Home`, lines);
   }
 
-  private generateCategoryPage(
-    category: string,
-    packets: PacketInfo[],
-    enums: Map<string, EnumInfo>,
-    dataClasses: Map<string, DataClassInfo>
-  ): void {
+  private generateCategoryPage(category: string, packets: PacketInfo[]): void {
     const lines: string[] = [];
-    const displayName = this.formatCategoryName(category);
+    const displayName = this.displayNames.get(category) ?? this.formatCategoryName(category);
 
     // Sort packets by packet ID
     const sortedPackets = packets.sort((a, b) => (a.packetId ?? 0) - (b.packetId ?? 0));
@@ -126,10 +256,7 @@ export class WikiGenerator {
     lines.push('');
 
     // Packet Index table
-    lines.push('## Packet Index');
-    lines.push('');
-    lines.push('| ID | Name | Package | Compressed | Max Size |');
-    lines.push('|----|------|---------|------------|----------|');
+    lines.push('## Packet Index', '', ...PACKET_INDEX_TABLE_HEAD);
 
     for (const packet of sortedPackets) {
       const id = packet.packetId !== undefined ? `\`0x${packet.packetId.toString(16).padStart(2, '0').toUpperCase()}\`` : '-';
@@ -139,28 +266,21 @@ export class WikiGenerator {
       const maxSize = this.formatByteSize(packet.maxSize);
       lines.push(`| ${id} | ${name} | ${pkg} | ${compressed} | ${maxSize} |`);
     }
-    lines.push('');
-    lines.push('---');
-    lines.push('');
+    lines.push('', '---', '');
 
     // Packet details
     for (const packet of sortedPackets) {
-      lines.push(...this.generatePacketSection(packet, enums, dataClasses));
-      lines.push('---');
-      lines.push('');
+      lines.push(...this.generatePacketSection(packet));
+      lines.push('---', '');
     }
 
     // Back link
-    lines.push(`[Back to Home](${this.pageName(`${this.version}-Home`)})`);
+    lines.push(`[Back to Home](${this.homePage})`);
 
     this.writePage(`${this.version}-${category}`, lines);
   }
 
-  private generatePacketSection(
-    packet: PacketInfo,
-    enums: Map<string, EnumInfo>,
-    dataClasses: Map<string, DataClassInfo>
-  ): string[] {
+  private generatePacketSection(packet: PacketInfo): string[] {
     const lines: string[] = [];
     const layout = this.layouts.get(packet.name);
 
@@ -168,8 +288,7 @@ export class WikiGenerator {
     lines.push('');
 
     // Metadata table with all static final constants
-    lines.push('| Property | Value |');
-    lines.push('|----------|-------|');
+    lines.push(...PROPERTY_TABLE_HEAD);
     if (packet.packetId !== undefined) {
       lines.push(`| Packet ID | \`0x${packet.packetId.toString(16).padStart(2, '0').toUpperCase()}\` (${packet.packetId}) |`);
     }
@@ -196,13 +315,20 @@ export class WikiGenerator {
 
       if (layout && layout.fields.length > 0) {
         // Enhanced table with wire layout information
-        lines.push('| Name | Type | Offset | Size | Encoding | Nullable |');
-        lines.push('|------|------|--------|------|----------|----------|');
+        lines.push(...LAYOUT_FIELDS_TABLE_HEAD);
+
+        // Index layout fields by name once instead of a linear find per field
+        const layoutByName = new Map<string, FieldLayoutInfo>();
+        for (const layoutField of layout.fields) {
+          if (!layoutByName.has(layoutField.name)) {
+            layoutByName.set(layoutField.name, layoutField);
+          }
+        }
 
         for (const field of packet.fields) {
-          const typeLink = this.formatTypeLink(field.javaType, enums, dataClasses);
+          const typeLink = this.formatTypeLink(field.javaType);
           const nullable = field.nullable ? 'Yes' : 'No';
-          const layoutField = layout.fields.find((f: FieldLayoutInfo) => f.name === field.name);
+          const layoutField = layoutByName.get(field.name);
 
           const offset = layoutField?.wireOffset !== undefined ? layoutField.wireOffset.toString() : '-';
           const size = layoutField?.wireSize !== undefined
@@ -214,11 +340,10 @@ export class WikiGenerator {
         }
       } else {
         // Basic table without layout information
-        lines.push('| Name | Type | Nullable | Max Length |');
-        lines.push('|------|------|----------|------------|');
+        lines.push(...BASIC_FIELDS_TABLE_HEAD);
 
         for (const field of packet.fields) {
-          const typeLink = this.formatTypeLink(field.javaType, enums, dataClasses);
+          const typeLink = this.formatTypeLink(field.javaType);
           const nullable = field.nullable ? 'Yes' : 'No';
           const maxLength = field.maxLength ? field.maxLength.toString() : '-';
 
@@ -235,8 +360,8 @@ export class WikiGenerator {
 
       // Add inline enum values for enum fields
       for (const field of packet.fields) {
-        const simpleName = field.javaType.split('.').pop() || field.javaType;
-        const enumInfo = enums.get(simpleName);
+        const simpleName = simpleTypeName(field.javaType);
+        const enumInfo = this.enums.get(simpleName);
         if (enumInfo && enumInfo.values.length > 0) {
           lines.push(`**${field.name}** enum values:`);
           lines.push('');
@@ -256,7 +381,7 @@ export class WikiGenerator {
 
     lines.push(`# Enums - ${this.version}`);
     lines.push('');
-    lines.push(`[← Back to ${this.version} Home](${this.pageName(`${this.version}-Home`)})`);
+    lines.push(`[← Back to ${this.version} Home](${this.homePage})`);
     lines.push('');
 
     // Table of contents
@@ -276,8 +401,7 @@ export class WikiGenerator {
       lines.push('');
 
       if (enumInfo.values.length > 0) {
-        lines.push('| Name | Value |');
-        lines.push('|------|-------|');
+        lines.push(...ENUM_VALUES_TABLE_HEAD);
 
         for (const value of enumInfo.values) {
           lines.push(`| \`${value.name}\` | ${value.value} |`);
@@ -289,15 +413,12 @@ export class WikiGenerator {
     this.writePage(`${this.version}-Enums`, lines);
   }
 
-  private generateDataTypesPage(
-    dataClasses: Map<string, DataClassInfo>,
-    enums: Map<string, EnumInfo>
-  ): void {
+  private generateDataTypesPage(dataClasses: Map<string, DataClassInfo>): void {
     const lines: string[] = [];
 
     lines.push(`# Data Types - ${this.version}`);
     lines.push('');
-    lines.push(`[← Back to ${this.version} Home](${this.pageName(`${this.version}-Home`)})`);
+    lines.push(`[← Back to ${this.version} Home](${this.homePage})`);
     lines.push('');
 
     // Table of contents
@@ -317,13 +438,10 @@ export class WikiGenerator {
       lines.push('');
 
       if (dataClass.fields.length > 0) {
-        lines.push('### Fields');
-        lines.push('');
-        lines.push('| Field | Type | Nullable |');
-        lines.push('|-------|------|----------|');
+        lines.push('### Fields', '', ...DATA_FIELDS_TABLE_HEAD);
 
         for (const field of dataClass.fields) {
-          const typeLink = this.formatTypeLink(field.javaType, enums, dataClasses);
+          const typeLink = this.formatTypeLink(field.javaType);
           const nullable = field.nullable ? 'Yes' : 'No';
 
           lines.push(`| \`${field.name}\` | ${typeLink} | ${nullable} |`);
@@ -335,99 +453,127 @@ export class WikiGenerator {
     this.writePage(`${this.version}-Data-Types`, lines);
   }
 
-  private generateVersionSidebar(packetsByCategory: Map<string, PacketInfo[]>): void {
+  private generateVersionSidebar(sortedCategories: string[]): void {
     const lines: string[] = [];
 
     lines.push(`## ${this.version}`);
     lines.push('');
-    lines.push(`- [Home](${this.pageName(`${this.version}-Home`)})`);
+    lines.push(`- [Home](${this.homePage})`);
 
-    const sortedCategories = Array.from(packetsByCategory.keys()).sort();
     for (const category of sortedCategories) {
-      const displayName = this.formatCategoryName(category);
+      const displayName = this.displayNames.get(category) ?? this.formatCategoryName(category);
       lines.push(`- [${displayName}](${this.pageName(`${this.version}-${category}`)})`);
     }
 
-    lines.push(`- [Enums](${this.pageName(`${this.version}-Enums`)})`);
-    lines.push(`- [Data Types](${this.pageName(`${this.version}-Data-Types`)})`);
+    lines.push(`- [Enums](${this.enumsPage})`);
+    lines.push(`- [Data Types](${this.dataTypesPage})`);
 
     this.writePage(`_Sidebar-${this.version}`, lines);
   }
 
-  private parseExistingVersionsFromHome(): Set<string> {
+  private addVersionsFromHome(versions: Set<string>): void {
     const homePath = join(this.outputDir, 'Home.md');
-    const versions = new Set<string>();
 
     if (existsSync(homePath)) {
       const content = readFileSync(homePath, 'utf-8');
-      const versionRegex = /\[([^\]]+)\]\([^)]*-Home\)/g;
-      let match;
-
-      while ((match = versionRegex.exec(content)) !== null) {
+      // Cheap substring gate before the full regex scan
+      if (!content.includes('-Home)')) return;
+      for (const match of content.matchAll(HOME_VERSION_LINK_RE)) {
         versions.add(match[1]);
       }
     }
+  }
+
+  /**
+   * Discover the known versions once per run, plus the version being
+   * generated. Both root-page generators share the memoized result, already
+   * sorted newest first, so the list is deduplicated and ordered exactly once.
+   *
+   * Every generated version writes a `<version>-Home.md`, so the directory
+   * listing is authoritative; the root Home and Sidebar are only re-parsed
+   * as a fallback when no version home pages exist on disk (e.g. a wiki
+   * checkout where only the hand-written root pages survive).
+   */
+  private collectVersions(): string[] {
+    if (this.sortedVersions === null) {
+      const versions = new Set<string>();
+      this.addVersionsFromDisk(versions);
+      if (versions.size === 0) {
+        this.addVersionsFromHome(versions);
+        this.addVersionsFromSidebar(versions);
+      }
+      versions.add(this.version);
+      this.sortedVersions = Array.from(versions).sort().reverse();
+    }
+    return this.sortedVersions;
+  }
 
-    return versions;
+  /** Versions whose home pages already exist in the output directory */
+  private addVersionsFromDisk(versions: Set<string>): void {
+    // withFileTypes reuses the type information the directory scan already
+    // has, so directories are skipped without a stat per entry
+    for (const entry of readdirSync(this.outputDir, { withFileTypes: true })) {
+      if (!entry.isFile()) continue;
+      const match = VERSION_HOME_FILE_RE.exec(entry.name);
+      if (match) {
+        versions.add(match[1]);
+      }
+    }
   }
 
   private generateRootHome(): void {
-    const versions = this.parseExistingVersionsFromHome();
-    versions.add(this.version);
+    const sortedVersions = this.collectVersions();
 
-    const lines: string[] = [];
+    const buf = new PageBuffer();
 
-    lines.push('# Hytale Protocol Documentation');
-    lines.push('');
-    lines.push('Welcome to the Hytale protocol documentation wiki.');
-    lines.push('');
-    lines.push('## Available Versions');
-    lines.push('');
+    buf.line('# Hytale Protocol Documentation');
+    buf.line('');
+    buf.line('Welcome to the Hytale protocol documentation wiki.');
+    buf.line('');
+    buf.line('## Available Versions');
+    buf.line('');
 
-    const sortedVersions = Array.from(versions).sort().reverse();
     for (const version of sortedVersions) {
-      lines.push(`- [${version}](${this.pageName(`${version}-Home`)})`);
+      buf.line(`- [${version}](${this.pageName(`${version}-Home`)})`);
     }
-    lines.push('');
+    buf.line('');
 
-    this.writePage('Home', lines);
+    this.writePage('Home', buf);
   }
 
-  private parseExistingVersionsFromSidebar(): Set<string> {
+  private addVersionsFromSidebar(versions: Set<string>): void {
     const sidebarPath = join(this.outputDir, '_Sidebar.md');
-    const versions = new Set<string>();
 
     if (existsSync(sidebarPath)) {
       const content = readFileSync(sidebarPath, 'utf-8');
-      const versionRegex = /## (.+)/g;
-      let match;
-
-      while ((match = versionRegex.exec(content)) !== null) {
+      // Cheap substring gate before the full regex scan
+      if (!content.includes('## ')) return;
+      for (const match of content.matchAll(SIDEBAR_VERSION_HEADING_RE)) {
         const version = match[1].trim();
         if (version !== 'Versions') {
           versions.add(version);
         }
       }
     }
-
-    return versions;
   }
 
   private generateRootSidebar(): void {
-    const versions = this.parseExistingVersionsFromSidebar();
-    versions.add(this.version);
+    const sortedVersions = this.collectVersions();
 
-    const lines: string[] = [];
+    const buf = new PageBuffer();
 
-    lines.push('## Versions');
-    lines.push('');
+    buf.line('## Versions');
+    buf.line('');
 
-    const sortedVersions = Array.from(versions).sort().reverse();
-    for (const version of sortedVersions) {
-      lines.push(`- [${version}](${this.pageName(`${version}-Home`)})`);
+    // The shared list is already sorted newest first, so the cap is a slice
+    for (const version of sortedVersions.slice(0, SIDEBAR_MAX_VERSIONS)) {
+      buf.line(`- [${version}](${this.pageName(`${version}-Home`)})`);
+    }
+    if (sortedVersions.length > SIDEBAR_MAX_VERSIONS) {
+      buf.line(`- […and ${sortedVersions.length - SIDEBAR_MAX_VERSIONS} more](Home)`);
     }
 
-    this.writePage('_Sidebar', lines);
+    this.writePage('_Sidebar', buf);
   }
 
   private formatCategoryName(category: string): string {
@@ -438,48 +584,96 @@ export class WikiGenerator {
   }
 
   private formatByteSize(bytes: number): string {
-    if (bytes <= 0) return '-';
-    if (bytes < 1024) return `${bytes} bytes`;
-    if (bytes < 1024 * 1024) {
-      const kb = bytes / 1024;
-      return `${kb % 1 === 0 ? kb : kb.toFixed(1)} KB`;
+    const cached = this.byteSizeCache.get(bytes);
+    if (cached !== undefined) return cached;
+
+    let formatted: string;
+    if (bytes <= 0) {
+      formatted = '-';
+    } else if (bytes < 1024) {
+      formatted = `${bytes} bytes`;
+    } else {
+      let divisor: number = BYTE_SIZE_UNITS[0][0];
+      let unit: string = BYTE_SIZE_UNITS[0][1];
+      for (const [threshold, name] of BYTE_SIZE_UNITS) {
+        if (bytes < threshold) break;
+        divisor = threshold;
+        unit = name;
+      }
+      const scaled = bytes / divisor;
+      // Whole multiples print without a decimal, everything else with one
+      formatted = `${scaled % 1 === 0 ? scaled : scaled.toFixed(1)} ${unit}`;
     }
-    const mb = bytes / (1024 * 1024);
-    return `${mb % 1 === 0 ? mb : mb.toFixed(1)} MB`;
+    this.byteSizeCache.set(bytes, formatted);
+    return formatted;
   }
 
-  private formatTypeLink(
-    javaType: string,
-    enums: Map<string, EnumInfo>,
-    dataClasses: Map<string, DataClassInfo>
-  ): string {
-    // Strip generic parameters for lookup
-    const baseType = javaType.replace(/<.*>/, '');
-    const simpleName = baseType.split('.').pop() || baseType;
-
-    // Check if it's an enum
-    if (enums.has(simpleName)) {
-      return `[${simpleName}](${this.pageName(`${this.version}-Enums`)}#${simpleName.toLowerCase()})`;
-    }
+  private formatTypeLink(javaType: string): string {
+    const cached = this.typeLinkCache.get(javaType);
+    if (cached !== undefined) return cached;
 
-    // Check if it's a data class
-    if (dataClasses.has(simpleName)) {
-      return `[${simpleName}](${this.pageName(`${this.version}-Data-Types`)}#${simpleName.toLowerCase()})`;
-    }
-
-    // Return as code
-    return `\`${javaType}\``;
+    // Strip generic parameters and package qualifiers for lookup; unknown
+    // types render as code
+    const simpleName = simpleTypeName(javaType);
+    const link = this.typeAnchors.get(simpleName) ?? `\`${javaType}\``;
+    this.typeLinkCache.set(javaType, link);
+    return link;
   }
 
   private pageName(page: string): string {
     return page.replace(/ /g, '-');
   }
 
-  private writePage(name: string, lines: string[]): void {
+  private writePage(name: string, lines: string[] | PageBuffer): void {
     const path = join(this.outputDir, `${name}.md`);
-    writeFileSync(path, lines.join('\n'), 'utf-8');
-    console.log(`  ✓ ${name}.md`);
+    // Encode once on the main thread into an exact-size buffer the write
+    // owns, then hand the disk I/O to libuv's pool so it overlaps with
+    // building the next page; generate() awaits the whole batch
+    const payload = Array.isArray(lines) ? lines.join('\n') : lines.toString();
+    const data = Buffer.from(payload, 'utf-8');
+    this.pendingWrites.push(writeIfChanged(path, data));
+  }
+}
+
+/**
+ * Write only when the on-disk bytes differ, so regenerating an unchanged
+ * wiki leaves mtimes alone and produces no spurious commits on push.
+ */
+async function writeIfChanged(path: string, data: Buffer): Promise<void> {
+  try {
+    const existing = await readFile(path);
+    if (existing.equals(data)) return;
+  } catch {
+    // Missing or unreadable page; fall through to the write
   }
+  await writeFile(path, data);
+}
+
+/** Re-indent a JSON.stringify block so it nests at the given padding depth */
+function indentJson(value: unknown, pad: string): string {
+  return JSON.stringify(value, null, 2).split('\n').join('\n' + pad);
+}
+
+// Projections from the parsed types onto the JSON summary shape. These rename
+// keys (javaType becomes type), so the summary schema stays decoupled from
+// the in-memory types and the shape is defined in one place.
+
+function summarizeField(f: PacketInfo['fields'][number]): Record<string, unknown> {
+  return {
+    name: f.name,
+    type: f.javaType,
+    nullable: f.nullable
+  };
+}
+
+function summarizePacket(p: PacketInfo): Record<string, unknown> {
+  return {
+    name: p.name,
+    packetId: p.packetId,
+    package: p.package,
+    fields: p.fields.map(summarizeField),
+    deserializeContext: p.deserializeContext
+  };
 }
 
 export function generateJsonSummary(
@@ -488,33 +682,38 @@ export function generateJsonSummary(
   outputPath: string,
   version: string
 ): void {
-  const summary: any = {
-    version,
-    categories: {},
-    enums: {}
-  };
-
-  for (const [category, packets] of packetsByCategory) {
-    summary.categories[category] = packets.map(p => ({
-      name: p.name,
-      packetId: p.packetId,
-      package: p.package,
-      fields: p.fields.map(f => ({
-        name: f.name,
-        type: f.javaType,
-        nullable: f.nullable
-      })),
-      deserializeContext: p.deserializeContext
-    }));
-  }
-
-  for (const [name, enumInfo] of enums) {
-    summary.enums[name] = {
-      package: enumInfo.package,
-      values: enumInfo.values
-    };
+  // Stream the summary to the file section by section instead of building
+  // the whole nested object and its serialized string in memory at once.
+  // The output stays byte-identical to JSON.stringify(summary, null, 2).
+  const fd = openSync(outputPath, 'w');
+  try {
+    writeSync(fd, `{\n  "version": ${JSON.stringify(version)},\n  "categories": {`);
+
+    let first = true;
+    for (const [category, packets] of packetsByCategory) {
+      writeSync(fd, `${first ? '' : ','}\n    ${JSON.stringify(category)}: [`);
+      let firstPacket = true;
+      for (const p of packets) {
+        writeSync(fd, `${firstPacket ? '' : ','}\n      ${indentJson(summarizePacket(p), '      ')}`);
+        firstPacket = false;
+      }
+      writeSync(fd, `${firstPacket ? '' : '\n    '}]`);
+      first = false;
+    }
+    writeSync(fd, `${first ? '' : '\n  '}},\n  "enums": {`);
+
+    first = true;
+    for (const [name, enumInfo] of enums) {
+      const payload = {
+        package: enumInfo.package,
+        values: enumInfo.values
+      };
+      writeSync(fd, `${first ? '' : ','}\n    ${JSON.stringify(name)}: ${indentJson(payload, '    ')}`);
+      first = false;
+    }
+    writeSync(fd, `${first ? '' : '\n  '}}\n}`);
+  } finally {
+    closeSync(fd);
   }
-
-  writeFileSync(outputPath, JSON.stringify(summary, null, 2), 'utf-8');
   console.log(`✓ Generated JSON summary: ${outputPath}`);
 }